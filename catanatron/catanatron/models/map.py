@@ -1,3 +1,4 @@
+import functools
 import typing
 from dataclasses import dataclass
 import random
@@ -383,6 +384,14 @@ def initialize_tiles(
     return all_tiles
 
 
+@functools.lru_cache(maxsize=None)
+def get_neighbor_coordinates(
+    coordinate: Coordinate,
+) -> Tuple[Tuple[Coordinate, Direction], ...]:
+    """(neighbor coordinate, direction) pairs around the given coordinate"""
+    return tuple((add(coordinate, UNIT_VECTORS[d]), d) for d in Direction)
+
+
 def get_nodes_and_edges(tiles, coordinate: Coordinate, node_autoinc):
     """Get pre-existing nodes and edges in board for given tile coordinate"""
     nodes = {
@@ -403,12 +412,11 @@ def get_nodes_and_edges(tiles, coordinate: Coordinate, node_autoinc):
     }
 
     # Find pre-existing ones
-    neighbor_tiles = [(add(coordinate, UNIT_VECTORS[d]), d) for d in Direction]
-    for coord, neighbor_direction in neighbor_tiles:
-        if coord not in tiles:
+    for coord, neighbor_direction in get_neighbor_coordinates(coordinate):
+        neighbor = tiles.get(coord)
+        if neighbor is None:
             continue
 
-        neighbor = tiles[coord]
         if neighbor_direction == Direction.EAST:
             nodes[NodeRef.NORTHEAST] = neighbor.nodes[NodeRef.NORTHWEST]
             nodes[NodeRef.SOUTHEAST] = neighbor.nodes[NodeRef.SOUTHWEST]
@@ -6,10 +6,10 @@ from flask_cors import CORS
 
 def create_app(test_config=None):
     """Create and configure an instance of the Flask application."""
-    # Get the path to the static build folder
-    static_folder = os.path.join(os.path.dirname(__file__), "static", "build")
-
-    app = Flask(__name__, static_folder=static_folder, static_url_path="")
+    # Static files are served by serve_static below (with the SPA fallback),
+    # so don't let Flask register its own /<path:filename> route, which
+    # would shadow it.
+    app = Flask(__name__, static_folder=None)
     CORS(app)
 
     # ===== Load base configuration
@@ -21,9 +21,12 @@ def create_app(test_config=None):
         SECRET_KEY=secret_key,
         SQLALCHEMY_DATABASE_URI=database_url,
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        MAX_CONTENT_LENGTH=64 * 1024,  # advisor boards are a few KB at most
+        STATIC_FOLDER=os.path.join(os.path.dirname(__file__), "static", "build"),
     )
     if test_config is not None:
         app.config.update(test_config)
+    app.static_folder = app.config["STATIC_FOLDER"]
 
     # ===== Initialize Database
     from catanatron.web.models import db
@@ -40,14 +43,29 @@ def create_app(test_config=None):
     app.register_blueprint(advisor_api.bp)
 
     # ===== Serve React App
+    # The build is immutable while serving, so index it once instead of
+    # stat-ing the filesystem on every request.
+    static_files = list_static_files(app.static_folder)
+
     @app.route("/")
     def serve():
         return send_from_directory(app.static_folder, "index.html")
 
     @app.route("/<path:path>")
     def serve_static(path):
-        if os.path.exists(os.path.join(app.static_folder, path)):
+        if path in static_files:
             return send_from_directory(app.static_folder, path)
         return send_from_directory(app.static_folder, "index.html")
 
     return app
+
+
+def list_static_files(static_folder):
+    """Relative ("/"-separated) paths of every file under static_folder."""
+    static_files = set()
+    for root, _, files in os.walk(static_folder):
+        relative_root = os.path.relpath(root, static_folder)
+        for filename in files:
+            path = os.path.normpath(os.path.join(relative_root, filename))
+            static_files.add(path.replace(os.sep, "/"))
+    return frozenset(static_files)
@@ -2,16 +2,17 @@
 Advisor API endpoint for recommending moves based on a custom board state.
 """
 
-import json
+import functools
 import logging
 import traceback
 from typing import Any, Dict, List, Optional, Tuple
-from collections import defaultdict
+from collections import Counter
 
+import orjson
 from flask import Response, Blueprint, jsonify, abort, request
 
 from catanatron.models.player import Color, Player
-from catanatron.models.board import Board
+from catanatron.models.board import Board, STATIC_GRAPH
 from catanatron.models.map import CatanMap, LandTile, Port, Water, BASE_MAP_TEMPLATE, get_nodes_and_edges, Direction
 from catanatron.models.enums import (
     RESOURCES,
@@ -32,10 +33,20 @@ from catanatron.state import State, PLAYER_INITIAL_STATE
 from catanatron.game import Game
 from catanatron.json import GameEncoder
 from catanatron.players.minimax import AlphaBetaPlayer
-from catanatron.state_functions import player_key
 
 bp = Blueprint("advisor", __name__, url_prefix="/api")
 
+_GAME_ENCODER = GameEncoder()
+
+
+def _default(obj):
+    """orjson fallback for types it can't serialize natively (e.g. Game)."""
+    return _GAME_ENCODER.default(obj)
+
+
+def _dumps(payload) -> bytes:
+    return orjson.dumps(payload, default=_default)
+
 # Coordinate to node ID mapping for standard board
 # This maps (cube_coord, direction) -> node_id based on standard board layout
 DIRECTION_TO_INDEX = {
@@ -47,6 +58,10 @@ DIRECTION_TO_INDEX = {
     "NORTHWEST": 5,
 }
 
+# Name to enum mappings (plain dict lookups instead of EnumMeta.__getitem__)
+COLOR_MAP = {color.name: color for color in Color}
+DIRECTION_MAP = {direction.name: direction for direction in Direction}
+
 # Resource string to FastResource mapping (FastResource is just string literals)
 RESOURCE_MAP = {
     "WOOD": WOOD,
@@ -65,6 +80,89 @@ DEV_CARD_MAP = {
     "MONOPOLY": "MONOPOLY",
 }
 
+# "<CARD>_IN_HAND" suffixes for the hand counts a request may set
+IN_HAND_KEYS = {card: f"{card}_IN_HAND" for card in (*RESOURCE_MAP, *DEV_CARD_MAP)}
+
+
+# Seating order (and its color -> index cache) for each supported player count
+COLORS_BY_COUNT: Dict[int, Tuple[Color, ...]] = {
+    n: (Color.RED, Color.BLUE, Color.ORANGE, Color.WHITE)[:n] for n in (2, 3, 4)
+}
+COLOR_TO_INDEX_BY_COUNT: Dict[int, Dict[Color, int]] = {
+    n: {color: i for i, color in enumerate(colors)}
+    for n, colors in COLORS_BY_COUNT.items()
+}
+
+# PLAYER_INITIAL_STATE suffixes the advisor writes into player_state
+ADVISOR_STATE_SUFFIXES = (
+    "SETTLEMENTS_AVAILABLE",
+    "CITIES_AVAILABLE",
+    "ROADS_AVAILABLE",
+    "VICTORY_POINTS",
+    "ACTUAL_VICTORY_POINTS",
+    "PLAYED_KNIGHT",
+    "HAS_ROLLED",
+    *IN_HAND_KEYS.values(),
+)
+
+
+def build_player_state_keys(num_players: int) -> Dict[Color, Dict[str, str]]:
+    """Map each seated color to its suffix -> player_state key."""
+    keys = {}
+    for i, color in enumerate(COLORS_BY_COUNT[num_players]):
+        p_key = f"P{i}"  # same as state_functions.player_key for seat i
+        keys[color] = {suffix: f"{p_key}_{suffix}" for suffix in ADVISOR_STATE_SUFFIXES}
+    return keys
+
+
+# Seat keys only depend on the player count, so build them once
+PLAYER_STATE_KEYS_BY_COUNT: Dict[int, Dict[Color, Dict[str, str]]] = {
+    n: build_player_state_keys(n) for n in COLORS_BY_COUNT
+}
+
+# AlphaBetaPlayer keeps no per-game state, so one instance per color is
+# reused across advisor requests
+ADVISOR_PLAYERS = {color: AlphaBetaPlayer(color, 2, True) for color in Color}
+
+# Outer ring positions of the standard board
+WATER_COORDS = (
+    (3, -3, 0), (2, -3, 1), (1, -3, 2), (0, -3, 3),
+    (-1, -2, 3), (-2, -1, 3), (-3, 0, 3), (-3, 1, 2),
+    (-3, 2, 1), (-3, 3, 0), (-2, 3, -1), (-1, 3, -2),
+    (0, 3, -3), (1, 2, -3), (2, 1, -3), (3, 0, -3),
+    (3, -1, -2), (3, -2, -1),
+)
+_WATER_TILES_CACHE: Optional[Tuple[Tuple[tuple, int], Dict[tuple, Water]]] = None
+
+# Land positions of the standard board
+LAND_COORDS = frozenset(
+    coordinate
+    for coordinate, tile_type in BASE_MAP_TEMPLATE.topology.items()
+    if tile_type is LandTile
+)
+
+# Dice numbers a resource tile can carry
+TILE_NUMBERS = (2, 3, 4, 5, 6, 8, 9, 10, 11, 12)
+
+# Upper bounds for list fields of an advisor request (standard board)
+MAX_REQUEST_ITEMS = {
+    "tiles": 19,
+    "ports": len(WATER_COORDS),
+    "buildings": 54,
+    "roads": 72,
+}
+
+# Keys every item of an advisor request list field must carry
+REQUIRED_ITEM_KEYS = {
+    "tiles": ("coordinate",),
+    "ports": ("coordinate", "direction"),
+    "buildings": ("node_id", "color", "building"),
+    "roads": ("edge_id", "color"),
+}
+
+# Actions serialized per chunk of a streamed all_actions list
+STREAM_CHUNK_SIZE = 64
+
 
 def create_custom_board(tiles_data: List[Dict], ports_data: List[Dict]) -> CatanMap:
     """Create a CatanMap from the provided tile and port configuration."""
@@ -105,39 +203,61 @@ def create_custom_board(tiles_data: List[Dict], ports_data: List[Dict]) -> Catan
         nodes, edges, node_autoinc = get_nodes_and_edges(all_tiles, coord, node_autoinc)
         
         fast_resource = RESOURCE_MAP.get(resource) if resource else None
-        direction = Direction[direction_str] if isinstance(direction_str, str) else direction_str
+        direction = DIRECTION_MAP[direction_str] if isinstance(direction_str, str) else direction_str
         port = Port(port_autoinc, fast_resource, direction, nodes, edges)
         all_tiles[coord] = port
         port_autoinc += 1
     
     # Add water tiles for remaining outer ring positions
-    water_coords = [
-        (3, -3, 0), (2, -3, 1), (1, -3, 2), (0, -3, 3),
-        (-1, -2, 3), (-2, -1, 3), (-3, 0, 3), (-3, 1, 2),
-        (-3, 2, 1), (-3, 3, 0), (-2, 3, -1), (-1, 3, -2),
-        (0, 3, -3), (1, 2, -3), (2, 1, -3), (3, 0, -3),
-        (3, -1, -2), (3, -2, -1),
-    ]
-    for coord in water_coords:
-        if coord not in all_tiles:
-            nodes, edges, node_autoinc = get_nodes_and_edges(all_tiles, coord, node_autoinc)
-            all_tiles[coord] = Water(nodes, edges)
+    add_water_tiles(all_tiles, node_autoinc)
     
     return CatanMap.from_tiles(all_tiles)
 
 
+def add_water_tiles(all_tiles: Dict, node_autoinc: int) -> None:
+    """Fill the outer ring positions not taken by all_tiles with Water tiles.
+
+    Water tiles only depend on the nodes/edges of the tiles already placed and
+    on how many node ids were allocated, so the result for the last seen
+    layout is cached and reused.
+    """
+    global _WATER_TILES_CACHE
+    layout = (
+        tuple(
+            (coord, tuple(tile.nodes.values()), tuple(tile.edges.values()))
+            for coord, tile in all_tiles.items()
+        ),
+        node_autoinc,
+    )
+    if _WATER_TILES_CACHE is not None and _WATER_TILES_CACHE[0] == layout:
+        all_tiles.update(_WATER_TILES_CACHE[1])
+        return
+
+    water_tiles = {}
+    for coord in WATER_COORDS:
+        if coord not in all_tiles:
+            nodes, edges, node_autoinc = get_nodes_and_edges(all_tiles, coord, node_autoinc)
+            all_tiles[coord] = water_tiles[coord] = Water(nodes, edges)
+    _WATER_TILES_CACHE = (layout, water_tiles)
+
+
 def create_game_from_advisor_request(data: Dict) -> Tuple[Game, Color]:
     """Create a Game object from the advisor request data."""
     num_players = data.get("num_players", 2)
     advised_player_str = data.get("advised_player", "RED")
-    advised_color = Color[advised_player_str]
+    advised_color = COLOR_MAP[advised_player_str]
     
     # Create players
-    colors = [Color.RED, Color.BLUE, Color.ORANGE, Color.WHITE][:num_players]
+    colors = COLORS_BY_COUNT[num_players]
     players = []
     for color in colors:
-        # Use AlphaBetaPlayer for AI decisions
-        player = AlphaBetaPlayer(color, 2, True)
+        if color == advised_color:
+            # Use AlphaBetaPlayer for AI decisions
+            player = ADVISOR_PLAYERS[color]
+            player.reset_state()
+        else:
+            # Only the advised player ever decides; others just hold a seat
+            player = Player(color)
         players.append(player)
     
     # Create custom map
@@ -154,50 +274,55 @@ def create_game_from_advisor_request(data: Dict) -> Tuple[Game, Color]:
     
     # Override the random seating order to match expected colors
     game.state.players = players
-    game.state.colors = tuple(colors)
-    game.state.color_to_index = {color: i for i, color in enumerate(colors)}
+    game.state.colors = colors
+    game.state.color_to_index = COLOR_TO_INDEX_BY_COUNT[num_players]
+    keys = PLAYER_STATE_KEYS_BY_COUNT[num_players]
     
     # Set up buildings
     buildings_data = data.get("buildings", [])
+    unbuildable_ids = set()
     for building_info in buildings_data:
         node_id = building_info["node_id"]
-        color = Color[building_info["color"]]
+        color = COLOR_MAP[building_info["color"]]
         building_type = SETTLEMENT if building_info["building"] == "SETTLEMENT" else CITY
         
         # Directly set the building (bypassing validation for advisor mode)
         game.state.board.buildings[node_id] = (color, building_type)
         game.state.buildings_by_color[color][building_type].append(node_id)
         
-        # Update board buildable IDs
-        game.state.board.board_buildable_ids.discard(node_id)
-        from catanatron.models.board import STATIC_GRAPH
-        for n in STATIC_GRAPH.neighbors(node_id):
-            game.state.board.board_buildable_ids.discard(n)
+        # Node and its neighbors are no longer buildable (applied below)
+        unbuildable_ids.add(node_id)
+        unbuildable_ids.update(STATIC_GRAPH.neighbors(node_id))
         
         # Update player state
-        p_key = player_key(game.state, color)
+        color_keys = keys[color]
         if building_type == SETTLEMENT:
-            game.state.player_state[f"{p_key}_SETTLEMENTS_AVAILABLE"] -= 1
-            game.state.player_state[f"{p_key}_VICTORY_POINTS"] += 1
-            game.state.player_state[f"{p_key}_ACTUAL_VICTORY_POINTS"] += 1
+            game.state.player_state[color_keys["SETTLEMENTS_AVAILABLE"]] -= 1
+            game.state.player_state[color_keys["VICTORY_POINTS"]] += 1
+            game.state.player_state[color_keys["ACTUAL_VICTORY_POINTS"]] += 1
         else:
-            game.state.player_state[f"{p_key}_CITIES_AVAILABLE"] -= 1
-            game.state.player_state[f"{p_key}_VICTORY_POINTS"] += 2
-            game.state.player_state[f"{p_key}_ACTUAL_VICTORY_POINTS"] += 2
+            game.state.player_state[color_keys["CITIES_AVAILABLE"]] -= 1
+            game.state.player_state[color_keys["VICTORY_POINTS"]] += 2
+            game.state.player_state[color_keys["ACTUAL_VICTORY_POINTS"]] += 2
+    game.state.board.board_buildable_ids.difference_update(unbuildable_ids)
     
     # Set up roads
     roads_data = data.get("roads", [])
+    roads = {}
+    road_counts: Counter = Counter()
     for road_info in roads_data:
-        edge_id = tuple(road_info["edge_id"])
-        color = Color[road_info["color"]]
-        
-        # Directly set the road
-        game.state.board.roads[edge_id] = color
-        game.state.board.roads[(edge_id[1], edge_id[0])] = color
+        a, b = road_info["edge_id"]
+        color = COLOR_MAP[road_info["color"]]
         
-        # Update player state
-        p_key = player_key(game.state, color)
-        game.state.player_state[f"{p_key}_ROADS_AVAILABLE"] -= 1
+        # Directly set the road (both directions, applied below)
+        roads[(a, b)] = color
+        roads[(b, a)] = color
+        road_counts[color] += 1
+    game.state.board.roads.update(roads)
+    
+    # Update player state
+    for color, count in road_counts.items():
+        game.state.player_state[keys[color]["ROADS_AVAILABLE"]] -= count
     
     # Set robber coordinate
     robber_coord = data.get("robber_coordinate")
@@ -211,30 +336,29 @@ def create_game_from_advisor_request(data: Dict) -> Tuple[Game, Color]:
     
     # Set resources for advised player
     player_resources = data.get("player_resources", {})
-    p_key = player_key(game.state, advised_color)
+    advised_keys = keys[advised_color]
     for resource_str, count in player_resources.items():
         if resource_str in RESOURCE_MAP:
-            game.state.player_state[f"{p_key}_{resource_str}_IN_HAND"] = count
+            game.state.player_state[advised_keys[IN_HAND_KEYS[resource_str]]] = count
     
     # Set development cards for advised player
     player_dev_cards = data.get("player_dev_cards", {})
     for card_type, count in player_dev_cards.items():
         if card_type in DEV_CARD_MAP:
-            game.state.player_state[f"{p_key}_{card_type}_IN_HAND"] = count
+            game.state.player_state[advised_keys[IN_HAND_KEYS[card_type]]] = count
     
     # Set played knights for other players
     players_knights = data.get("players_knights", {})
     for color_str, count in players_knights.items():
-        other_color = Color[color_str]
-        other_p_key = player_key(game.state, other_color)
-        game.state.player_state[f"{other_p_key}_PLAYED_KNIGHT"] = count
+        other_color = COLOR_MAP[color_str]
+        game.state.player_state[keys[other_color]["PLAYED_KNIGHT"]] = count
     
     # Mark as not initial build phase (post-setup game)
     game.state.is_initial_build_phase = False
     game.state.current_prompt = ActionPrompt.PLAY_TURN
     
     # Set HAS_ROLLED to true (assuming turn is after rolling)
-    game.state.player_state[f"{p_key}_HAS_ROLLED"] = True
+    game.state.player_state[advised_keys["HAS_ROLLED"]] = True
     
     # Generate playable actions
     game.state.playable_actions = generate_playable_actions(game.state)
@@ -252,12 +376,139 @@ def format_action(action: Action) -> str:
 
 def calculate_victory_points(game: Game) -> Dict[str, int]:
     """Calculate victory points for each player."""
-    vps = {}
-    for color in game.state.colors:
-        p_key = player_key(game.state, color)
-        vp = game.state.player_state[f"{p_key}_ACTUAL_VICTORY_POINTS"]
-        vps[color.value] = vp
-    return vps
+    player_state = game.state.player_state
+    keys = PLAYER_STATE_KEYS_BY_COUNT[len(game.state.colors)]
+    return {
+        color.value: player_state[keys[color]["ACTUAL_VICTORY_POINTS"]]
+        for color in game.state.colors
+    }
+
+
+def _loads_request_json():
+    """Parse the request body with orjson (None if missing or invalid)."""
+    if not request.is_json:
+        return None
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _is_int_list(value, length: int) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == length
+        and all(isinstance(x, int) for x in value)
+    )
+
+
+def _is_count(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
+def validate_advisor_request(data) -> Optional[str]:
+    """Cheap shape checks on an advisor request. Returns an error message, if any."""
+    if not isinstance(data, dict):
+        return "Request body must be a JSON object"
+    num_players = data.get("num_players", 2)
+    if not isinstance(num_players, int) or num_players not in COLORS_BY_COUNT:
+        return f"num_players must be one of {sorted(COLORS_BY_COUNT)}"
+    colors = {color.name for color in COLORS_BY_COUNT[num_players]}
+    advised_player = data.get("advised_player", "RED")
+    if not isinstance(advised_player, str) or advised_player not in colors:
+        return f"advised_player must be one of {sorted(colors)}"
+
+    for field, max_items in MAX_REQUEST_ITEMS.items():
+        items = data.get(field, [])
+        if not isinstance(items, list) or len(items) > max_items:
+            return f"{field} must be a list of at most {max_items} items"
+        required_keys = REQUIRED_ITEM_KEYS[field]
+        if not all(
+            isinstance(item, dict) and all(key in item for key in required_keys)
+            for item in items
+        ):
+            return f"{field} items must be objects with keys {list(required_keys)}"
+    for field in ("player_resources", "player_dev_cards", "players_knights"):
+        counts = data.get(field, {})
+        if not isinstance(counts, dict):
+            return f"{field} must be an object"
+        if not all(_is_count(count) for count in counts.values()):
+            return f"{field} counts must be non-negative integers"
+
+    coordinates = set()
+    for field, valid_coords in (("tiles", LAND_COORDS), ("ports", WATER_COORDS)):
+        for item in data.get(field, []):
+            if not _is_int_list(item["coordinate"], 3):
+                return "coordinate must be a list of 3 integers"
+            coordinate = tuple(item["coordinate"])
+            if coordinate not in valid_coords:
+                return f"{field} coordinate {list(coordinate)} is not on the standard board"
+            if coordinate in coordinates:
+                return f"Duplicate tile coordinate {list(coordinate)}"
+            coordinates.add(coordinate)
+    for tile_info in data.get("tiles", []):
+        resource, number = tile_info.get("resource"), tile_info.get("number")
+        if resource is not None and not (isinstance(resource, str) and resource in RESOURCE_MAP):
+            return f"tile resource must be one of {list(RESOURCE_MAP)} or null"
+        if resource is not None and not (isinstance(number, int) and number in TILE_NUMBERS):
+            return f"tile number must be one of {list(TILE_NUMBERS)}"
+
+    robber_coordinate = data.get("robber_coordinate")
+    if robber_coordinate is not None:
+        land_coords = {tuple(t["coordinate"]) for t in data.get("tiles", [])} or LAND_COORDS
+        if not _is_int_list(robber_coordinate, 3) or tuple(robber_coordinate) not in land_coords:
+            return "robber_coordinate must be the coordinate of a land tile"
+    for port_info in data.get("ports", []):
+        direction = port_info["direction"]
+        if not isinstance(direction, str) or direction not in DIRECTION_MAP:
+            return f"port direction must be one of {sorted(DIRECTION_MAP)}"
+    for building_info in data.get("buildings", []):
+        node_id = building_info["node_id"]
+        if not isinstance(node_id, int) or node_id not in STATIC_GRAPH:
+            return f"Invalid building node_id {node_id!r}"
+        if building_info["building"] not in ("SETTLEMENT", "CITY"):
+            return "building must be SETTLEMENT or CITY"
+    for road_info in data.get("roads", []):
+        if not _is_int_list(road_info["edge_id"], 2):
+            return "edge_id must be a list of 2 integers"
+
+    item_colors = [b["color"] for b in data.get("buildings", [])]
+    item_colors += [r["color"] for r in data.get("roads", [])]
+    item_colors += list(data.get("players_knights", {}))
+    for color in item_colors:
+        if not isinstance(color, str) or color not in colors:
+            return f"color {color!r} is not one of the seated colors {sorted(colors)}"
+    return None
+
+
+def _encode_actions(actions: List[Action]) -> bytes:
+    return b",".join(_dumps(format_action(a)) for a in actions)
+
+
+def _stream_with_all_actions(payload: Dict[str, Any], actions: List[Action]):
+    """Payload as streamed JSON with an "all_actions" list, encoding actions lazily.
+
+    The head and first chunk are encoded eagerly, so failures there surface
+    in the caller (before a 200 is sent). Failures in later chunks are logged.
+    """
+    head = _dumps(payload)[:-1]
+    separator = b"," if len(head) > 1 else b""
+    first_chunk = head + separator + b'"all_actions":[' + _encode_actions(
+        actions[:STREAM_CHUNK_SIZE]
+    )
+
+    def generate():
+        yield first_chunk
+        try:
+            for start in range(STREAM_CHUNK_SIZE, len(actions), STREAM_CHUNK_SIZE):
+                yield b"," + _encode_actions(actions[start : start + STREAM_CHUNK_SIZE])
+        except Exception as e:
+            logging.error(f"Error streaming advisor actions: {str(e)}")
+            logging.error(traceback.format_exc())
+            raise
+        yield b"]}"
+
+    return generate()
 
 
 @bp.route("/advisor", methods=["POST"])
@@ -265,12 +516,20 @@ def advisor_endpoint():
     """Get AI recommendation for a custom board state."""
     logging.info("Advisor request received")
     
-    if not request.is_json or request.json is None:
+    data = _loads_request_json()
+    if data is None:
         abort(400, description="Missing or invalid JSON body")
     
+    # Reject malformed requests before paying for map/game construction
+    error = validate_advisor_request(data)
+    if error is not None:
+        return Response(
+            response=_dumps({"success": False, "error": error}),
+            status=400,
+            mimetype="application/json",
+        )
+    
     try:
-        data = request.json
-        
         # Create game from request data
         game, advised_color = create_game_from_advisor_request(data)
         
@@ -279,7 +538,7 @@ def advisor_endpoint():
         
         if len(playable_actions) == 0:
             return Response(
-                response=json.dumps({
+                response=_dumps({
                     "success": True,
                     "action_type": "NO_ACTIONS",
                     "action_value": None,
@@ -298,17 +557,27 @@ def advisor_endpoint():
         # Format the response
         action_type = recommended_action.action_type.name if hasattr(recommended_action.action_type, 'name') else str(recommended_action.action_type)
         
-        explanation = generate_explanation(recommended_action, game, advised_color)
+        explanation = generate_explanation(recommended_action)
         
+        payload = {
+            "success": True,
+            "action_type": action_type,
+            "action_value": recommended_action.value,
+            "explanation": explanation,
+            "victory_points": calculate_victory_points(game),
+        }
+        
+        # Listing every playable action is opt-in; most callers only want the advice
+        if data.get("include_all_actions", False):
+            return Response(
+                response=_stream_with_all_actions(payload, playable_actions),
+                status=200,
+                mimetype="application/json",
+            )
+        
+        payload["all_actions"] = []
         return Response(
-            response=json.dumps({
-                "success": True,
-                "action_type": action_type,
-                "action_value": recommended_action.value,
-                "explanation": explanation,
-                "victory_points": calculate_victory_points(game),
-                "all_actions": [format_action(a) for a in playable_actions],
-            }),
+            response=_dumps(payload),
             status=200,
             mimetype="application/json",
         )
@@ -317,7 +586,7 @@ def advisor_endpoint():
         logging.error(f"Error in advisor endpoint: {str(e)}")
         logging.error(traceback.format_exc())
         return Response(
-            response=json.dumps({
+            response=_dumps({
                 "success": False,
                 "error": str(e),
                 "trace": traceback.format_exc(),
@@ -327,127 +596,130 @@ def advisor_endpoint():
         )
 
 
-def generate_explanation(action: Action, game: Game, advised_color: Color) -> str:
+def _explain_maritime_trade(value) -> str:
+    if value:
+        give_resource = value[0] if len(value) > 0 else "resources"
+        get_resource = value[-1] if len(value) > 1 else "resources"
+        return f"Trade {give_resource} for {get_resource} using a port or bank trade."
+    return "Make a maritime/bank trade to get the resources you need."
+
+
+def _explain_move_robber(value) -> str:
+    if value:
+        coord = value[0] if len(value) > 0 else "a tile"
+        return f"Move the robber to {coord}. This blocks resource production and lets you steal."
+    return "Move the robber to block an opponent's production."
+
+
+# ActionType -> formatter of the action value into a human-readable explanation
+EXPLANATIONS = {
+    ActionType.END_TURN: lambda value: "End your turn. No better moves available with current resources.",
+    ActionType.BUILD_SETTLEMENT: lambda value: f"Build a settlement at node {value}. This expands your resource production.",
+    ActionType.BUILD_CITY: lambda value: f"Upgrade settlement at node {value} to a city. This doubles resource production from that location.",
+    ActionType.BUILD_ROAD: lambda value: f"Build a road at edge {value}. This helps connect settlements and work toward longest road.",
+    ActionType.BUY_DEVELOPMENT_CARD: lambda value: "Buy a development card. Development cards provide powerful abilities and potential victory points.",
+    ActionType.PLAY_KNIGHT_CARD: lambda value: "Play a knight card. This allows you to move the robber and steal a resource.",
+    ActionType.MARITIME_TRADE: _explain_maritime_trade,
+    ActionType.MOVE_ROBBER: _explain_move_robber,
+    ActionType.PLAY_ROAD_BUILDING: lambda value: "Play Road Building card to build two roads for free.",
+    ActionType.PLAY_YEAR_OF_PLENTY: lambda value: f"Play Year of Plenty to get free resources: {value}",
+    ActionType.PLAY_MONOPOLY: lambda value: f"Play Monopoly to take all {value} from other players.",
+}
+
+
+def generate_explanation(action: Action) -> str:
     """Generate a human-readable explanation for the recommended action."""
-    action_type = action.action_type
-    value = action.value
-    
-    if action_type == ActionType.END_TURN:
-        return "End your turn. No better moves available with current resources."
-    
-    elif action_type == ActionType.BUILD_SETTLEMENT:
-        return f"Build a settlement at node {value}. This expands your resource production."
-    
-    elif action_type == ActionType.BUILD_CITY:
-        return f"Upgrade settlement at node {value} to a city. This doubles resource production from that location."
-    
-    elif action_type == ActionType.BUILD_ROAD:
-        return f"Build a road at edge {value}. This helps connect settlements and work toward longest road."
-    
-    elif action_type == ActionType.BUY_DEVELOPMENT_CARD:
-        return "Buy a development card. Development cards provide powerful abilities and potential victory points."
-    
-    elif action_type == ActionType.PLAY_KNIGHT_CARD:
-        return "Play a knight card. This allows you to move the robber and steal a resource."
-    
-    elif action_type == ActionType.MARITIME_TRADE:
-        if value:
-            give_resource = value[0] if len(value) > 0 else "resources"
-            get_resource = value[-1] if len(value) > 1 else "resources"
-            return f"Trade {give_resource} for {get_resource} using a port or bank trade."
-        return "Make a maritime/bank trade to get the resources you need."
-    
-    elif action_type == ActionType.MOVE_ROBBER:
-        if value:
-            coord = value[0] if len(value) > 0 else "a tile"
-            return f"Move the robber to {coord}. This blocks resource production and lets you steal."
-        return "Move the robber to block an opponent's production."
-    
-    elif action_type == ActionType.PLAY_ROAD_BUILDING:
-        return "Play Road Building card to build two roads for free."
-    
-    elif action_type == ActionType.PLAY_YEAR_OF_PLENTY:
-        return f"Play Year of Plenty to get free resources: {value}"
-    
-    elif action_type == ActionType.PLAY_MONOPOLY:
-        return f"Play Monopoly to take all {value} from other players."
-    
-    else:
-        return f"Recommended action: {action_type}"
+    explain = EXPLANATIONS.get(action.action_type)
+    if explain is None:
+        return f"Recommended action: {action.action_type}"
+    return explain(action.value)
+
+
+def _build_board_template_payload() -> Dict[str, Any]:
+    """Build the standard board template with node and edge IDs."""
+    catan_map = CatanMap.from_template(BASE_MAP_TEMPLATE)
+
+    # Build nodes info - collect all tiles that share each node
+    node_coords: Dict[int, List[tuple]] = {}  # node_id -> [coord, ...]
+    node_first_dir: Dict[int, str] = {}  # node_id -> direction on first tile
+    edges = {}
+    tiles_info = []
+
+    for coordinate, tile in catan_map.tiles.items():
+        if isinstance(tile, LandTile):
+            tile_info = {
+                "coordinate": coordinate,
+                "id": tile.id,
+                "type": "DESERT" if tile.resource is None else "RESOURCE_TILE",
+                "resource": tile.resource if tile.resource else None,
+                "number": tile.number,
+            }
+            tiles_info.append(tile_info)
+
+            # Add nodes for this tile - track all tiles that share this node
+            # (tile.nodes/tile.edges are keyed by NodeRef/EdgeRef enums)
+            for direction, node_id in tile.nodes.items():
+                coords = node_coords.get(node_id)
+                if coords is None:
+                    node_coords[node_id] = [coordinate]
+                    node_first_dir[node_id] = direction.name
+                else:
+                    coords.append(coordinate)
+
+            # Add edges for this tile
+            for direction, edge in tile.edges.items():
+                edge_id = tuple(sorted(edge))
+                if edge_id not in edges:
+                    edges[edge_id] = {
+                        "node_ids": list(edge),
+                        "tile_coordinate": coordinate,
+                        "direction": direction.name,
+                    }
+
+        elif isinstance(tile, Port):
+            tile_info = {
+                "coordinate": coordinate,
+                "id": tile.id,
+                "type": "PORT",
+                "direction": tile.direction.name,
+                "resource": tile.resource if tile.resource else None,
+            }
+            tiles_info.append(tile_info)
+
+    # Build final nodes list with all tile coordinates
+    nodes_list = [
+        {
+            "id": node_id,
+            "tile_coordinates": tile_coordinates,
+            "direction": node_first_dir[node_id],  # Direction on first tile
+        }
+        for node_id, tile_coordinates in node_coords.items()
+    ]
+
+    return {
+        "success": True,
+        "tiles": tiles_info,
+        "nodes": nodes_list,
+        "edges": list(edges.values()),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _board_template_json() -> bytes:
+    """Serialized board template. The topology is static, so build it only once.
+
+    Note resources/numbers come from a single shuffle of BASE_MAP_TEMPLATE; the
+    client only consumes the coordinates and node/edge IDs.
+    """
+    return _dumps(_build_board_template_payload())
 
 
 @bp.route("/advisor/board-template", methods=["GET"])
 def get_board_template():
     """Get the standard board template with node and edge IDs."""
     try:
-        catan_map = CatanMap.from_template(BASE_MAP_TEMPLATE)
-        
-        # Build nodes info - collect all tiles that share each node
-        node_tiles: Dict[int, List[Tuple[tuple, str]]] = defaultdict(list)  # node_id -> [(coord, direction), ...]
-        edges = {}
-        tiles_info = []
-        
-        for coordinate, tile in catan_map.tiles.items():
-            if isinstance(tile, LandTile):
-                tile_info = {
-                    "coordinate": coordinate,
-                    "id": tile.id,
-                    "type": "DESERT" if tile.resource is None else "RESOURCE_TILE",
-                    "resource": tile.resource if tile.resource else None,
-                    "number": tile.number,
-                }
-                tiles_info.append(tile_info)
-                
-                # Add nodes for this tile - track all tiles that share this node
-                for direction, node_id in tile.nodes.items():
-                    # direction might be an enum or string, handle both
-                    dir_name = direction.name if hasattr(direction, 'name') else str(direction)
-                    node_tiles[node_id].append((coordinate, dir_name))
-                
-                # Add edges for this tile
-                for direction, edge in tile.edges.items():
-                    edge_id = tuple(sorted(edge))
-                    if edge_id not in edges:
-                        # direction might be an enum or string, handle both
-                        dir_name = direction.name if hasattr(direction, 'name') else str(direction)
-                        edges[edge_id] = {
-                            "node_ids": list(edge),
-                            "tile_coordinate": coordinate,
-                            "direction": dir_name,
-                        }
-            
-            elif isinstance(tile, Port):
-                # direction might be an enum or string, handle both
-                port_dir_name = tile.direction.name if hasattr(tile.direction, 'name') else str(tile.direction)
-                tile_info = {
-                    "coordinate": coordinate,
-                    "id": tile.id,
-                    "type": "PORT",
-                    "direction": port_dir_name,
-                    "resource": tile.resource if tile.resource else None,
-                }
-                tiles_info.append(tile_info)
-        
-        # Build final nodes list with all tile coordinates
-        nodes_list = []
-        for node_id, tile_list in node_tiles.items():
-            # Get all tile coordinates that share this node
-            tile_coordinates = [coord for coord, _ in tile_list]
-            # Use the first tile's direction for reference
-            first_tile_coord, first_direction = tile_list[0]
-            nodes_list.append({
-                "id": node_id,
-                "tile_coordinates": tile_coordinates,
-                "direction": first_direction,  # Direction on first tile
-            })
-        
         return Response(
-            response=json.dumps({
-                "success": True,
-                "tiles": tiles_info,
-                "nodes": nodes_list,
-                "edges": list(edges.values()),
-            }),
+            response=_board_template_json(),
             status=200,
             mimetype="application/json",
         )
@@ -456,7 +728,7 @@ def get_board_template():
         logging.error(f"Error getting board template: {str(e)}")
         logging.error(traceback.format_exc())
         return Response(
-            response=json.dumps({
+            response=_dumps({
                 "success": False,
                 "error": str(e),
             }),
@@ -0,0 +1,31 @@
+import pytest
+from catanatron.web import create_app
+from catanatron.web.models import db
+
+
+@pytest.fixture
+def app():
+    """Create and configure a new app instance for each test."""
+    # Setup an in-memory SQLite database for testing
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "SECRET_KEY": "test",
+        }
+    )
+
+    with app.app_context():
+        db.create_all()
+
+    yield app
+
+    # Teardown: drop all tables after each test (optional, if tests are isolated)
+    # with app.app_context():
+    #     db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    """A test client for the app."""
+    return app.test_client()
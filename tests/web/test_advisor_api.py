@@ -0,0 +1,307 @@
+import pytest
+import json
+from catanatron.models.enums import Action, ActionType
+from catanatron.models.map import Water, get_nodes_and_edges
+from catanatron.models.player import Color
+from catanatron.state import PLAYER_INITIAL_STATE
+from catanatron.state_functions import player_key
+from catanatron.web.advisor_api import (
+    create_custom_board,
+    create_game_from_advisor_request,
+    generate_explanation,
+    ADVISOR_STATE_SUFFIXES,
+    PLAYER_STATE_KEYS_BY_COUNT,
+    _stream_with_all_actions,
+)
+from catanatron.web import advisor_api
+
+
+@pytest.fixture
+def template(client):
+    """The advisor board template, as served to the UI."""
+    return json.loads(client.get("/api/advisor/board-template").data)
+
+
+def build_advisor_request(template, **overrides):
+    """Build an advisor request body from the board template."""
+    request_body = {
+        "num_players": 2,
+        "advised_player": "RED",
+        "tiles": [
+            {
+                "coordinate": tile["coordinate"],
+                "resource": tile["resource"],
+                "number": tile["number"],
+            }
+            for tile in template["tiles"]
+            if tile["type"] != "PORT"
+        ],
+        "ports": [
+            {
+                "coordinate": tile["coordinate"],
+                "direction": tile["direction"],
+                "resource": tile["resource"],
+            }
+            for tile in template["tiles"]
+            if tile["type"] == "PORT"
+        ],
+        "buildings": [
+            {"node_id": 0, "color": "RED", "building": "SETTLEMENT"},
+            {"node_id": 10, "color": "BLUE", "building": "CITY"},
+        ],
+        "roads": [
+            {"edge_id": [0, 1], "color": "RED"},
+            {"edge_id": [10, 11], "color": "BLUE"},
+        ],
+        "robber_coordinate": [0, 0, 0],
+        "player_resources": {"WOOD": 1, "BRICK": 1, "SHEEP": 0, "WHEAT": 2, "ORE": 3},
+        "player_dev_cards": {"KNIGHT": 1},
+        "players_knights": {"BLUE": 1},
+    }
+    request_body.update(overrides)
+    return request_body
+
+
+def test_get_board_template(client):
+    response = client.get("/api/advisor/board-template")
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["success"] is True
+    assert len([t for t in data["tiles"] if t["type"] != "PORT"]) == 19
+    assert len([t for t in data["tiles"] if t["type"] == "PORT"]) == 9
+    assert len(data["nodes"]) == 54
+    assert len(data["edges"]) == 72
+
+
+def test_get_board_template_is_stable(client):
+    first = client.get("/api/advisor/board-template")
+    second = client.get("/api/advisor/board-template")
+    assert first.data == second.data
+
+
+def test_advisor_endpoint(client, template):
+    response = client.post("/api/advisor", json=build_advisor_request(template))
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["success"] is True
+    assert data["victory_points"] == {"RED": 1, "BLUE": 2}
+    assert data["all_actions"] == []
+
+
+def test_advisor_endpoint_include_all_actions(client, template):
+    response = client.post(
+        "/api/advisor", json=build_advisor_request(template, include_all_actions=True)
+    )
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert "BUILD_CITY: 0" in data["all_actions"]
+
+
+def test_create_custom_board_reuses_water_tiles(template, monkeypatch):
+    request_body = build_advisor_request(template)
+    placed_coordinates = []
+
+    def counting_get_nodes_and_edges(tiles, coordinate, node_autoinc):
+        placed_coordinates.append(coordinate)
+        return get_nodes_and_edges(tiles, coordinate, node_autoinc)
+
+    monkeypatch.setattr(advisor_api, "_WATER_TILES_CACHE", None)
+    monkeypatch.setattr(advisor_api, "get_nodes_and_edges", counting_get_nodes_and_edges)
+    first = create_custom_board(request_body["tiles"], request_body["ports"])
+    assert len(placed_coordinates) == 19 + 9 + 9  # land, ports, water
+
+    placed_coordinates.clear()
+    second = create_custom_board(request_body["tiles"], request_body["ports"])
+    assert len(placed_coordinates) == 19 + 9  # water tiles come from the cache
+    for coordinate, tile in second.tiles.items():
+        if isinstance(tile, Water):
+            assert tile is first.tiles[coordinate]
+
+
+@pytest.mark.parametrize("duplicate_last_tile", [False, True])
+def test_create_custom_board_water_cache_matches_fresh_build(
+    template, monkeypatch, duplicate_last_tile
+):
+    request_body = build_advisor_request(template)
+    tiles, ports = request_body["tiles"], request_body["ports"]
+    variant = tiles + [tiles[-1]] if duplicate_last_tile else tiles
+
+    create_custom_board(tiles, ports)  # prime the cache with the standard layout
+    cached = create_custom_board(variant, ports)
+    monkeypatch.setattr(advisor_api, "_WATER_TILES_CACHE", None)
+    fresh = create_custom_board(variant, ports)
+    assert cached.tiles == fresh.tiles
+
+
+def test_create_custom_board_ignores_tile_order(template):
+    request_body = build_advisor_request(template)
+    tiles = request_body["tiles"]
+    presorted = sorted(tiles, key=lambda t: tuple(t["coordinate"]))
+
+    shuffled_map = create_custom_board(list(reversed(tiles)), request_body["ports"])
+    presorted_map = create_custom_board(presorted, request_body["ports"])
+    assert shuffled_map.tiles == presorted_map.tiles
+
+
+def test_create_game_from_advisor_request_roads(template):
+    request_body = build_advisor_request(
+        template,
+        roads=[
+            {"edge_id": [0, 1], "color": "RED"},
+            {"edge_id": [0, 5], "color": "RED"},
+            {"edge_id": [10, 11], "color": "BLUE"},
+        ],
+    )
+
+    game, advised_color = create_game_from_advisor_request(request_body)
+    assert advised_color == Color.RED
+    assert game.state.board.roads[(0, 1)] == Color.RED
+    assert game.state.board.roads[(1, 0)] == Color.RED
+    assert game.state.board.roads[(5, 0)] == Color.RED
+    assert game.state.board.roads[(11, 10)] == Color.BLUE
+    assert game.state.player_state["P0_ROADS_AVAILABLE"] == 13
+    assert game.state.player_state["P1_ROADS_AVAILABLE"] == 14
+
+
+def test_advisor_endpoint_invalid_json(client):
+    response = client.post(
+        "/api/advisor", data="{not json", content_type="application/json"
+    )
+    assert response.status_code == 400
+
+    response = client.post("/api/advisor", data="{}", content_type="text/plain")
+    assert response.status_code == 400
+
+
+def test_generate_explanation():
+    assert generate_explanation(
+        Action(Color.RED, ActionType.BUILD_CITY, 3)
+    ).startswith("Upgrade settlement at node 3")
+    assert generate_explanation(
+        Action(Color.RED, ActionType.MARITIME_TRADE, ("WOOD",) * 4 + ("ORE",))
+    ) == "Trade WOOD for ORE using a port or bank trade."
+    assert generate_explanation(
+        Action(Color.RED, ActionType.ROLL, None)
+    ) == "Recommended action: ActionType.ROLL"
+
+
+@pytest.mark.parametrize("num_actions", [0, 1, 64, 130])
+def test_stream_with_all_actions(num_actions):
+    actions = [Action(Color.RED, ActionType.BUILD_ROAD, (i, i + 1)) for i in range(num_actions)]
+    body = b"".join(_stream_with_all_actions({"success": True}, actions))
+
+    data = json.loads(body)
+    assert data["success"] is True
+    assert data["all_actions"] == [f"BUILD_ROAD: ({i}, {i + 1})" for i in range(num_actions)]
+
+
+def test_stream_with_all_actions_empty_payload():
+    body = b"".join(_stream_with_all_actions({}, []))
+    assert json.loads(body) == {"all_actions": []}
+
+
+def test_advisor_endpoint_action_encoding_error(client, template, monkeypatch):
+    def broken_format_action(action):
+        raise ValueError("cannot format")
+
+    monkeypatch.setattr(advisor_api, "format_action", broken_format_action)
+    response = client.post(
+        "/api/advisor", json=build_advisor_request(template, include_all_actions=True)
+    )
+    assert response.status_code == 500
+    data = json.loads(response.data)
+    assert data["success"] is False
+    assert data["error"] == "cannot format"
+
+
+def test_stream_with_all_actions_logs_late_errors(monkeypatch, caplog):
+    def format_action(action):
+        if action.value[0] >= 64:
+            raise ValueError("cannot format")
+        return "ok"
+
+    monkeypatch.setattr(advisor_api, "format_action", format_action)
+    actions = [Action(Color.RED, ActionType.BUILD_ROAD, (i, i + 1)) for i in range(70)]
+    stream = _stream_with_all_actions({"success": True}, actions)
+    next(stream)
+    with pytest.raises(ValueError):
+        next(stream)
+    assert "Error streaming advisor actions" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"num_players": 5},
+        {"advised_player": "WHITE"},
+        {"advised_player": "PURPLE"},
+        {"buildings": "not a list"},
+        {"roads": [[0, 1]]},
+        {"tiles": [{}] * 20},
+        {"player_resources": []},
+        {"num_players": [2]},
+        {"advised_player": ["RED"]},
+        {"advised_player": {"a": 1}},
+        {"buildings": [{"node_id": 0, "color": "PURPLE", "building": "CITY"}]},
+        {"buildings": [{"node_id": 0, "color": "WHITE", "building": "CITY"}]},
+        {"buildings": [{"node_id": [0], "color": "RED", "building": "CITY"}]},
+        {"buildings": [{"node_id": 500, "color": "RED", "building": "CITY"}]},
+        {"buildings": [{"node_id": 0, "color": "RED", "building": "CASTLE"}]},
+        {"buildings": [{"node_id": 0, "color": "RED"}]},
+        {"roads": [{"edge_id": [0, 1], "color": ["RED"]}]},
+        {"roads": [{"edge_id": "0,1", "color": "RED"}]},
+        {"roads": [{"color": "RED"}]},
+        {"players_knights": {"ORANGE": 1}},
+        {"tiles": [{"coordinate": [0, 0, 0]}, {"coordinate": [0, 0, 0]}]},
+        {"tiles": [{"coordinate": [0, 0]}]},
+        {"ports": [{"coordinate": [3, -3, 0], "direction": "UP"}]},
+        {"robber_coordinate": [0, 0]},
+        {"robber_coordinate": "abc"},
+        {"robber_coordinate": [3, -3, 0]},
+        {"robber_coordinate": [9, 9, 9]},
+        {"tiles": [{"coordinate": [0, 0, 0], "resource": None}], "robber_coordinate": [1, -1, 0]},
+        {"player_resources": {"WOOD": "3"}},
+        {"player_resources": {"WOOD": -1}},
+        {"player_dev_cards": {"KNIGHT": 1.5}},
+        {"players_knights": {"BLUE": "x"}},
+        {"players_knights": {"BLUE": True}},
+        {"tiles": [{"coordinate": [9, 9, 9]}]},
+        {"tiles": [{"coordinate": [3, -3, 0]}]},
+        {"ports": [{"coordinate": [0, 0, 0], "direction": "EAST"}]},
+        {"tiles": [{"coordinate": [0, 0, 0], "resource": ["WOOD"], "number": 8}]},
+        {"tiles": [{"coordinate": [0, 0, 0], "resource": "WOOD", "number": 7}]},
+        {"tiles": [{"coordinate": [0, 0, 0], "resource": "WOOD", "number": "8"}]},
+    ],
+)
+def test_advisor_endpoint_rejects_malformed_request(client, template, overrides):
+    response = client.post(
+        "/api/advisor", json=build_advisor_request(template, **overrides)
+    )
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert data["success"] is False
+    assert "error" in data
+
+
+def test_advisor_endpoint_rejects_oversized_body(client):
+    response = client.post(
+        "/api/advisor",
+        data=b'{"padding": "' + b"x" * (64 * 1024) + b'"}',
+        content_type="application/json",
+    )
+    assert response.status_code == 413
+
+
+def test_player_state_keys_by_count():
+    assert set(ADVISOR_STATE_SUFFIXES) <= set(PLAYER_INITIAL_STATE)
+    keys = PLAYER_STATE_KEYS_BY_COUNT[3]
+    assert list(keys) == [Color.RED, Color.BLUE, Color.ORANGE]
+    assert keys[Color.ORANGE]["WOOD_IN_HAND"] == "P2_WOOD_IN_HAND"
+
+
+def test_player_state_keys_match_player_key(template):
+    game, _ = create_game_from_advisor_request(
+        build_advisor_request(template, num_players=4)
+    )
+    for color, keys in PLAYER_STATE_KEYS_BY_COUNT[4].items():
+        assert keys["VICTORY_POINTS"] == f"{player_key(game.state, color)}_VICTORY_POINTS"
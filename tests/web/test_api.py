@@ -1,37 +1,9 @@
 import pytest
 import json
-from catanatron.web import create_app
+from catanatron.web import create_app, list_static_files
 from catanatron.web.models import db, GameState
 
 
-@pytest.fixture
-def app():
-    """Create and configure a new app instance for each test."""
-    # Setup an in-memory SQLite database for testing
-    app = create_app(
-        {
-            "TESTING": True,
-            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
-            "SECRET_KEY": "test",
-        }
-    )
-
-    with app.app_context():
-        db.create_all()
-
-    yield app
-
-    # Teardown: drop all tables after each test (optional, if tests are isolated)
-    # with app.app_context():
-    #     db.drop_all()
-
-
-@pytest.fixture
-def client(app):
-    """A test client for the app."""
-    return app.test_client()
-
-
 def test_post_game_endpoint(client):
     """Test creating a new game."""
     response = client.post("/api/games", json={"players": ["RANDOM", "RANDOM"]})
@@ -127,3 +99,34 @@ def test_stress_test_endpoint(client):
     assert response.status_code == 200
     data = json.loads(response.data)
     assert data["winning_color"] is None
+
+
+def test_list_static_files(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("")
+    (tmp_path / "assets" / "main.js").write_text("")
+
+    assert list_static_files(str(tmp_path)) == {"index.html", "assets/main.js"}
+    assert list_static_files(str(tmp_path / "missing")) == frozenset()
+
+
+def test_serve_static_build(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html>app</html>")
+    (tmp_path / "assets" / "main.js").write_text("console.log(1)")
+    app = create_app(
+        {
+            "TESTING": True,
+            "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            "STATIC_FOLDER": str(tmp_path),
+        }
+    )
+    client = app.test_client()
+
+    assert client.get("/assets/main.js").data == b"console.log(1)"
+    assert client.get("/").data == b"<html>app</html>"
+    # SPA deep links fall back to index.html
+    assert client.get("/advisor").data == b"<html>app</html>"
+    assert client.get("/games/abc").data == b"<html>app</html>"
+    # API routes still win over the catch-all
+    assert client.get("/api/advisor/board-template").status_code == 200
@@ -629,6 +629,7 @@ export default function AdvisorScreen() {
         player_resources: advisedPlayerState.resources,
         player_dev_cards: advisedPlayerState.devCards,
         players_knights: playersKnights,
+        include_all_actions: true,
       };
       
       const response = await getAdvisorRecommendation(request);
@@ -38,6 +38,7 @@ export type AdvisorRequest = {
   players_knights: {
     [K in Color]?: number;
   };
+  include_all_actions?: boolean;
 };
 
 export type AdvisorResponse = {